@@ -18,7 +18,13 @@ The admin interface allows superusers to:
 - View reaction statistics and user interactions
 """
 
+import csv
+import itertools
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import F
+from django.http import StreamingHttpResponse
 from .models import Room, RoomMembership, Announcement, AnnouncementReaction
 
 
@@ -31,14 +37,11 @@ class RoomAdmin(admin.ModelAdmin):
     viewing room details, managing memberships, and monitoring activity.
     """
     list_display = ['room_name', 'room_code', 'created_by', 'created_at', 'member_count']
+    list_select_related = ['created_by']
+    raw_id_fields = ['created_by']
     list_filter = ['created_at', 'updated_at']
     search_fields = ['room_name', 'room_code', 'created_by__username']
-    readonly_fields = ['room_code', 'created_at', 'updated_at']
-    
-    def member_count(self, obj):
-        """Display the number of members in the room."""
-        return obj.memberships.count()
-    member_count.short_description = 'Members'
+    readonly_fields = ['room_code', 'member_count', 'created_at', 'updated_at']
 
 
 @admin.register(RoomMembership)
@@ -49,11 +52,20 @@ class RoomMembershipAdmin(admin.ModelAdmin):
     Manages user memberships and role assignments within rooms.
     """
     list_display = ['user', 'room', 'role', 'joined_at', 'promoted_by']
+    list_select_related = ['user', 'room', 'promoted_by']
+    raw_id_fields = ['user', 'room', 'promoted_by']
     list_filter = ['role', 'joined_at', 'promoted_at']
     search_fields = ['user__username', 'room__room_name']
     readonly_fields = ['joined_at', 'promoted_at']
 
 
+class AnnouncementChangeList(ChangeList):
+    """Announcement changelist that leaves the body out of its query."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        return super().get_queryset(request, *args, **kwargs).defer('content')
+
+
 @admin.register(Announcement)
 class AnnouncementAdmin(admin.ModelAdmin):
     """
@@ -62,14 +74,30 @@ class AnnouncementAdmin(admin.ModelAdmin):
     Provides moderation and management capabilities for announcements.
     """
     list_display = ['title', 'room', 'author', 'created_at', 'reaction_count']
+    list_select_related = ['room', 'author']
+    raw_id_fields = ['room', 'author']
     list_filter = ['created_at', 'room', 'author']
     search_fields = ['title', 'content', 'author__username', 'room__room_name']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = [
+        'like_count', 'love_count', 'laugh_count', 'wow_count', 'sad_count', 'angry_count',
+        'created_at', 'updated_at',
+    ]
+    
+    def get_changelist(self, request, **kwargs):
+        """
+        Use a changelist that defers the announcement body, which it never
+        displays; the change view and other admin pages still load it.
+        """
+        return AnnouncementChangeList
     
     def reaction_count(self, obj):
         """Display the number of reactions on the announcement."""
-        return obj.reactions.count()
+        return obj.total_reactions()
     reaction_count.short_description = 'Reactions'
+    reaction_count.admin_order_field = (
+        F('like_count') + F('love_count') + F('laugh_count')
+        + F('wow_count') + F('sad_count') + F('angry_count')
+    )
 
 
 @admin.register(AnnouncementReaction)
@@ -80,6 +108,42 @@ class AnnouncementReactionAdmin(admin.ModelAdmin):
     Monitors user reactions and engagement with announcements.
     """
     list_display = ['user', 'announcement', 'reaction_type', 'created_at']
+    list_select_related = ['user', 'announcement', 'announcement__room']
+    raw_id_fields = ['user', 'announcement']
     list_filter = ['reaction_type', 'created_at']
     search_fields = ['user__username', 'announcement__title']
-    readonly_fields = ['created_at']
\ No newline at end of file
+    readonly_fields = ['created_at']
+    list_per_page = 100
+    actions = ['export_as_csv']
+    
+    @admin.action(description='Export selected reactions as CSV')
+    def export_as_csv(self, request, queryset):
+        """
+        Stream the selected reactions as a CSV download.
+        
+        Rows are read in chunks with QuerySet.iterator() and written out as
+        they arrive, so memory use stays flat however many reactions are
+        selected.
+        """
+        rows = queryset.order_by().values_list(
+            'user__username',
+            'announcement__title',
+            'announcement__room__room_name',
+            'reaction_type',
+            'created_at',
+        ).iterator(chunk_size=1000)
+        writer = csv.writer(_Echo())
+        header = ['user', 'announcement', 'room', 'reaction_type', 'created_at']
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in itertools.chain([header], rows)),
+            content_type='text/csv',
+        )
+        response['Content-Disposition'] = 'attachment; filename="reactions.csv"'
+        return response
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+    
+    def write(self, value):
+        return value
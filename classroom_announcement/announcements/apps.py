@@ -29,3 +29,7 @@ class AnnouncementsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'announcements'
     verbose_name = 'Classroom Announcements'
+    
+    def ready(self):
+        # Connect the signal handlers that maintain denormalized counters
+        from . import signals  # noqa: F401
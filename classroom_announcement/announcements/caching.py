@@ -0,0 +1,116 @@
+"""
+Cache helpers for the Classroom Announcement Application.
+
+The home and account dashboards are built from several queries but change
+only when the user's rooms, memberships, announcements or reactions do.
+Their template context is cached per user and invalidated by the signal
+handlers in signals.py whenever one of those rows is written.
+
+The rendered announcement list on the room page is cached as a template
+fragment keyed on a per-room version token, which the same signal handlers
+replace whenever an announcement or reaction in the room changes.
+
+Functions:
+    home_cache_key(user_id): Cache key for a user's home dashboard context
+    account_cache_key(user_id): Cache key for a user's account page context
+    invalidate_dashboards(user_ids): Drop cached dashboards for the given users
+    room_user_ids(room_id): IDs of the owner and all members of a room
+    get_announcements_version(room_id): Current announcement list version of a room
+    bump_announcements_version(room_id): Give a room's announcement list a new version
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+from .models import Room, RoomMembership
+
+
+# How long a dashboard context may be served from cache, in seconds.
+# Writes invalidate it immediately; the timeout only bounds missed invalidations.
+DASHBOARD_CACHE_TIMEOUT = 60
+
+# How long a rendered announcement list fragment is kept, in seconds.
+# Version bumps only reach instances sharing the cache, so without a shared
+# backend (no REDIS_URL in production) this bounds how long other instances
+# serve a stale list; keep it no longer than the dashboard timeout.
+ANNOUNCEMENT_LIST_CACHE_TIMEOUT = DASHBOARD_CACHE_TIMEOUT
+
+
+def home_cache_key(user_id):
+    """Build the cache key for a user's home dashboard context."""
+    return f'announcements:home:{user_id}'
+
+
+def account_cache_key(user_id):
+    """Build the cache key for a user's account page context."""
+    return f'announcements:account:{user_id}'
+
+
+def invalidate_dashboards(user_ids):
+    """
+    Drop the cached home and account contexts for the given users.
+
+    Args:
+        user_ids (Iterable[int]): IDs of the users whose dashboards changed
+    """
+    keys = []
+    for user_id in set(user_ids):
+        keys.append(home_cache_key(user_id))
+        keys.append(account_cache_key(user_id))
+    if keys:
+        cache.delete_many(keys)
+
+
+def room_user_ids(room_id):
+    """
+    Get the IDs of everyone whose dashboard shows the given room.
+
+    Args:
+        room_id (int): ID of the room
+
+    Returns:
+        set[int]: IDs of the room owner and all members
+    """
+    user_ids = set(RoomMembership.objects.filter(room_id=room_id).values_list('user_id', flat=True))
+    user_ids.update(Room.objects.filter(pk=room_id).values_list('created_by_id', flat=True))
+    return user_ids
+
+
+def _announcements_version_key(room_id):
+    """Build the cache key holding a room's announcement list version."""
+    return f'announcements:room-announcements-version:{room_id}'
+
+
+def get_announcements_version(room_id):
+    """
+    Get the version token of a room's announcement list.
+
+    The token is part of the fragment cache key for the rendered list, so
+    replacing it makes every cached copy of the list unreachable.
+
+    Args:
+        room_id (int): ID of the room
+
+    Returns:
+        str: The room's current version token
+    """
+    version = cache.get(_announcements_version_key(room_id))
+    if version is None:
+        version = bump_announcements_version(room_id)
+    return version
+
+
+def bump_announcements_version(room_id):
+    """
+    Give a room's announcement list a new version token.
+
+    Args:
+        room_id (int): ID of the room whose announcements or reactions changed
+
+    Returns:
+        str: The new version token
+    """
+    version = uuid.uuid4().hex
+    cache.set(_announcements_version_key(room_id), version, None)
+    return version
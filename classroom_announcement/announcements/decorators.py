@@ -0,0 +1,63 @@
+"""
+View decorators for the Classroom Announcement Application.
+
+The room management views all start the same way: load the room from the
+``room_id`` URL argument and refuse the request unless the current user holds
+a high enough role in it. ``require_room_role`` does both once and hands the
+loaded room to the view on ``request.room``.
+
+Functions:
+    require_room_role(role, error_message, redirect_to): Restrict a room view by role
+"""
+
+import functools
+
+from django.contrib import messages
+from django.shortcuts import get_object_or_404, redirect
+
+from .models import Room, RoomMembership
+
+
+def require_room_role(role, error_message, redirect_to='room_detail'):
+    """
+    Restrict a room view to its owner, or to its owner and admins.
+
+    The wrapped view must take ``room_id`` as its first URL argument. The room
+    is loaded once and stored on ``request.room``, with the user's role in it
+    on ``request.room_role``. The owner check only compares the room's
+    ``created_by`` with the user, like Room.is_owner; a membership row with the
+    owner role does not make its user the owner. The admin check costs at most
+    one role lookup (see Room.get_member_role).
+
+    Args:
+        role (str): Minimum role required, RoomMembership.OWNER or RoomMembership.ADMIN
+        error_message (str): Message flashed when the user lacks the role
+        redirect_to (str): URL name to redirect to when refused; 'room_detail'
+            redirects back to the room itself
+
+    Returns:
+        function: Decorator applying the check to a view
+    """
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, room_id, *args, **kwargs):
+            room = get_object_or_404(Room, id=room_id)
+
+            if role == RoomMembership.OWNER:
+                allowed = room.is_owner(request.user)
+                user_role = RoomMembership.OWNER
+            else:
+                user_role = room.get_user_role(request.user)
+                allowed = user_role in RoomMembership.ADMIN_ROLES
+
+            if not allowed:
+                messages.error(request, error_message)
+                if redirect_to == 'room_detail':
+                    return redirect('room_detail', room_id=room_id)
+                return redirect(redirect_to)
+
+            request.room = room
+            request.room_role = user_role
+            return view_func(request, room_id, *args, **kwargs)
+        return wrapper
+    return decorator
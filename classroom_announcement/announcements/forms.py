@@ -16,12 +16,67 @@ All forms include custom styling and validation appropriate for
 the glassmorphism design theme of the application.
 """
 
+import re
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth.models import User
 from .models import Room, Announcement
 
 
+# Room codes are exactly six ASCII letters or digits. str.isalnum() would also
+# accept non-ASCII letters and digits that can never match a generated code.
+_ROOM_CODE_RE = re.compile(r'[A-Za-z0-9]{6}')
+
+
+# Widget attributes shared by every instance of the forms below. They are
+# copied into each widget's own attrs dict, so sharing them is safe.
+_USERNAME_ATTRS = {
+    'class': 'form-input',
+    'placeholder': 'Enter your username',
+    'id': 'username'
+}
+
+_PASSWORD_ATTRS = {
+    'class': 'form-input',
+    'placeholder': 'Enter your password',
+    'id': 'password'
+}
+
+_ROOM_NAME_CREATE_ATTRS = {
+    'class': 'form-input',
+    'placeholder': 'Enter room name (e.g., Math 101, Physics Lab)',
+    'id': 'room_name'
+}
+
+_ROOM_CODE_CREATE_ATTRS = {
+    'class': 'form-input',
+    'placeholder': 'Enter 6-character room code (e.g., ABC123)',
+    'id': 'room_code',
+    'maxlength': '6',
+    'minlength': '6'
+}
+
+_ANNOUNCEMENT_TITLE_ATTRS = {
+    'class': 'form-input',
+    'placeholder': 'Enter announcement title',
+    'id': 'announcement_title'
+}
+
+_ANNOUNCEMENT_CONTENT_ATTRS = {
+    'class': 'form-textarea',
+    'placeholder': 'Write your announcement content here...',
+    'id': 'announcement_content',
+    'rows': '5'
+}
+
+_ROOM_NAME_EDIT_ATTRS = {
+    'class': 'form-input',
+    'placeholder': 'Enter room name',
+    'id': 'room_name'
+}
+
+
 class CustomSignUpForm(UserCreationForm):
     """
     Custom user registration form with simplified fields.
@@ -48,17 +103,9 @@ class CustomSignUpForm(UserCreationForm):
         super().__init__(*args, **kwargs)
         
         # Customize field attributes
-        self.fields['username'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter your username',
-            'id': 'username'
-        })
+        self.fields['username'].widget.attrs.update(_USERNAME_ATTRS)
         
-        self.fields['password1'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter your password',
-            'id': 'password'
-        })
+        self.fields['password1'].widget.attrs.update(_PASSWORD_ATTRS)
         
         # Remove password2 field
         if 'password2' in self.fields:
@@ -102,17 +149,9 @@ class CustomSignInForm(AuthenticationForm):
         super().__init__(*args, **kwargs)
         
         # Customize field attributes
-        self.fields['username'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter your username',
-            'id': 'username'
-        })
+        self.fields['username'].widget.attrs.update(_USERNAME_ATTRS)
         
-        self.fields['password'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter your password',
-            'id': 'password'
-        })
+        self.fields['password'].widget.attrs.update(_PASSWORD_ATTRS)
 
 class RoomCreationForm(forms.ModelForm):
     """
@@ -135,24 +174,19 @@ class RoomCreationForm(forms.ModelForm):
     class Meta:
         model = Room
         fields = ['room_name', 'room_code']
+        error_messages = {
+            'room_code': {
+                'unique': "This room code is already taken. Please choose another.",
+            },
+        }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
         # Customize field attributes
-        self.fields['room_name'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter room name (e.g., Math 101, Physics Lab)',
-            'id': 'room_name'
-        })
+        self.fields['room_name'].widget.attrs.update(_ROOM_NAME_CREATE_ATTRS)
         
-        self.fields['room_code'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter 6-character room code (e.g., ABC123)',
-            'id': 'room_code',
-            'maxlength': '6',
-            'minlength': '6'
-        })
+        self.fields['room_code'].widget.attrs.update(_ROOM_CODE_CREATE_ATTRS)
         
         # Add help text
         self.fields['room_name'].help_text = "Choose a descriptive name for your classroom"
@@ -166,17 +200,19 @@ class RoomCreationForm(forms.ModelForm):
             str: Uppercase, validated room code
             
         Raises:
-            ValidationError: If code is invalid or already exists
+            ValidationError: If code is invalid
+            
+        Notes:
+            Uniqueness is checked by the model's unique validation, which
+            reports the "already taken" message from Meta.error_messages.
         """
         room_code = self.cleaned_data.get('room_code')
         if room_code:
-            room_code = room_code.upper()
             if len(room_code) != 6:
                 raise forms.ValidationError("Room code must be exactly 6 characters long.")
-            if not room_code.isalnum():
+            if not _ROOM_CODE_RE.fullmatch(room_code):
                 raise forms.ValidationError("Room code can only contain letters and numbers.")
-            if Room.objects.filter(room_code=room_code).exists():
-                raise forms.ValidationError("This room code is already taken. Please choose another.")
+            room_code = room_code.upper()
         return room_code
 
 
@@ -195,7 +231,12 @@ class JoinRoomForm(forms.Form):
         - Code must contain only letters and numbers
         - Room with the code must exist
         - User must not already be a member
+        
+    Attributes:
+        room (Room): The room matching the code, set once the form is valid
     """
+    room = None
+    
     room_code = forms.CharField(
         max_length=6,
         min_length=6,
@@ -212,16 +253,22 @@ class JoinRoomForm(forms.Form):
         """
         Validate that the room code exists.
         
+        The matched room is kept on ``self.room`` so the view can use it
+        without looking it up again.
+        
         Returns:
             str: Uppercase room code
             
         Raises:
-            ValidationError: If room doesn't exist
+            ValidationError: If code is malformed or room doesn't exist
         """
         room_code = self.cleaned_data.get('room_code')
         if room_code:
+            if not _ROOM_CODE_RE.fullmatch(room_code):
+                raise forms.ValidationError("Room code can only contain letters and numbers.")
             room_code = room_code.upper()
-            if not Room.objects.filter(room_code=room_code).exists():
+            self.room = Room.objects.filter(room_code=room_code).only('id', 'room_name', 'created_by_id').first()
+            if self.room is None:
                 raise forms.ValidationError("Room with this code does not exist.")
         return room_code
 
@@ -252,18 +299,9 @@ class AnnouncementForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         
         # Customize field attributes
-        self.fields['title'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter announcement title',
-            'id': 'announcement_title'
-        })
+        self.fields['title'].widget.attrs.update(_ANNOUNCEMENT_TITLE_ATTRS)
         
-        self.fields['content'].widget.attrs.update({
-            'class': 'form-textarea',
-            'placeholder': 'Write your announcement content here...',
-            'id': 'announcement_content',
-            'rows': '5'
-        })
+        self.fields['content'].widget.attrs.update(_ANNOUNCEMENT_CONTENT_ATTRS)
         
         # Add help text
         self.fields['title'].help_text = "Give your announcement a clear, descriptive title"
@@ -293,8 +331,4 @@ class RoomEditForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        self.fields['room_name'].widget.attrs.update({
-            'class': 'form-input',
-            'placeholder': 'Enter room name',
-            'id': 'room_name'
-        })
+        self.fields['room_name'].widget.attrs.update(_ROOM_NAME_EDIT_ATTRS)
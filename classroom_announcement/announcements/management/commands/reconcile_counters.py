@@ -0,0 +1,38 @@
+"""
+Management command to recompute denormalized counters.
+
+Room.member_count and the per-type reaction tallies on Announcement are
+maintained by signal handlers. This command rebuilds them from the
+RoomMembership and AnnouncementReaction tables, for use after bulk
+operations that bypass signals or as a periodic sanity check.
+
+Usage:
+    python manage.py reconcile_counters
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef
+
+from announcements.models import Announcement, AnnouncementReaction, Room, RoomMembership
+from announcements.queries import count_subquery
+
+
+class Command(BaseCommand):
+    help = "Recompute Room.member_count and Announcement reaction tallies from the source tables."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rooms = Room.objects.update(
+                member_count=count_subquery(RoomMembership.objects.filter(room=OuterRef('pk')), 'room')
+            )
+            announcements = Announcement.objects.update(**{
+                field: count_subquery(
+                    AnnouncementReaction.objects.filter(announcement=OuterRef('pk'), reaction_type=reaction_type),
+                    'announcement',
+                )
+                for reaction_type, field in AnnouncementReaction.COUNT_FIELDS.items()
+            })
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled counters for {rooms} rooms and {announcements} announcements."
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-15 21:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0004_roommembership_promoted_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['room', '-created_at'], name='announcemen_room_id_c5586f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roommembership',
+            index=models.Index(fields=['room', 'role'], name='announcemen_room_id_bb2318_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-15 21:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_member_count(apps, schema_editor):
+    Room = apps.get_model('announcements', 'Room')
+    RoomMembership = apps.get_model('announcements', 'RoomMembership')
+    counts = (
+        RoomMembership.objects.filter(room=OuterRef('pk'))
+        .order_by()
+        .values('room')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    Room.objects.update(member_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0005_announcement_announcemen_room_id_c5586f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='room',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Members'),
+        ),
+        migrations.RunPython(backfill_member_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2 on 2026-10-15 21:25
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+REACTION_TYPES = ['like', 'love', 'laugh', 'wow', 'sad', 'angry']
+
+
+def backfill_reaction_counts(apps, schema_editor):
+    Announcement = apps.get_model('announcements', 'Announcement')
+    AnnouncementReaction = apps.get_model('announcements', 'AnnouncementReaction')
+    counts = {}
+    for reaction_type in REACTION_TYPES:
+        subquery = (
+            AnnouncementReaction.objects.filter(announcement=OuterRef('pk'), reaction_type=reaction_type)
+            .order_by()
+            .values('announcement')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+        counts[f'{reaction_type}_count'] = Coalesce(Subquery(subquery), 0)
+    Announcement.objects.update(**counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0006_room_member_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='angry_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='laugh_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='love_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='sad_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='wow_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_reaction_counts, migrations.RunPython.noop),
+    ]
@@ -13,8 +13,79 @@ Classes:
 
 from django.db import models
 from django.contrib.auth.models import User
+import os
 import string
-import random
+
+
+ROOM_CODE_LENGTH = 6
+ROOM_CODE_ALPHABET = (string.ascii_uppercase + string.digits).encode()
+
+# Number of candidate codes checked per query in Room.generate_room_code
+ROOM_CODE_BATCH_SIZE = 16
+
+# Largest multiple of the alphabet size that fits in a byte; bytes at or above
+# it are rejected so that ``byte % 36`` stays uniformly distributed.
+_ROOM_CODE_BYTE_LIMIT = 256 - 256 % len(ROOM_CODE_ALPHABET)
+
+
+def _random_room_code():
+    """
+    Build one random room code from OS-provided random bytes.
+    
+    Returns:
+        str: A 6-character code of uppercase letters and digits
+    """
+    code = bytearray()
+    while len(code) < ROOM_CODE_LENGTH:
+        for byte in os.urandom(ROOM_CODE_LENGTH + 2):
+            if byte < _ROOM_CODE_BYTE_LIMIT:
+                code.append(ROOM_CODE_ALPHABET[byte % len(ROOM_CODE_ALPHABET)])
+                if len(code) == ROOM_CODE_LENGTH:
+                    break
+    return code.decode()
+
+
+class RoomManager(models.Manager):
+    """
+    Manager for Room with helpers for loading related membership data.
+    
+    Methods:
+        with_members(): Rooms with memberships, users and promoters prefetched
+        existing_codes(codes): Subset of the given room codes already in use
+    """
+    
+    def with_members(self):
+        """
+        Get rooms with their memberships prefetched.
+        
+        Each membership comes with its user and promoting user joined in, so
+        listing a room's members costs two queries in total. Pages that only
+        need the number of members should annotate a count instead.
+        
+        Returns:
+            QuerySet[Room]: Rooms with ``memberships`` prefetched
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                'memberships',
+                queryset=RoomMembership.objects.select_related('user', 'promoted_by'),
+            )
+        )
+    
+    def existing_codes(self, codes):
+        """
+        Find which of the given room codes are already taken.
+        
+        All codes are checked with a single query, so bulk room creation can
+        validate a whole batch at once instead of querying code by code.
+        
+        Args:
+            codes (Iterable[str]): Candidate room codes
+            
+        Returns:
+            set[str]: The codes that belong to an existing room
+        """
+        return set(self.filter(room_code__in=codes).values_list('room_code', flat=True))
 
 
 class Room(models.Model):
@@ -28,6 +99,8 @@ class Room(models.Model):
         room_name (CharField): Unique name of the room (max 100 chars)
         room_code (CharField): Unique 6-character alphanumeric code for joining
         created_by (ForeignKey): User who created the room (owner)
+        member_count (PositiveIntegerField): Number of memberships, kept in
+            sync by the RoomMembership signal handlers
         created_at (DateTimeField): Timestamp when room was created
         updated_at (DateTimeField): Timestamp when room was last updated
     
@@ -37,6 +110,7 @@ class Room(models.Model):
         is_member(user): Check if user is a member
         can_access(user): Check if user can access the room
         get_user_role(user): Get user's role in the room
+        get_member_role(user): Get user's membership role (cached per instance)
         get_admins(): Get all admin users
         get_members(): Get all regular member users
         generate_room_code(): Static method to generate unique room codes
@@ -44,9 +118,12 @@ class Room(models.Model):
     room_name = models.CharField(max_length=100, verbose_name="Room Name", unique=True)
     room_code = models.CharField(max_length=6, unique=True, verbose_name="Room Code")
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name="created_rooms")
+    member_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="Members")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = RoomManager()
+    
     class Meta:
         verbose_name = "Room"
         verbose_name_plural = "Rooms"
@@ -65,7 +142,7 @@ class Room(models.Model):
         Returns:
             bool: True if user is the room owner, False otherwise
         """
-        return self.created_by == user
+        return self.created_by_id == user.pk
     
     def is_admin(self, user):
         """
@@ -82,8 +159,7 @@ class Room(models.Model):
         """
         if self.is_owner(user):
             return True
-        membership = RoomMembership.objects.filter(room=self, user=user).first()
-        return membership and membership.is_admin()
+        return self.get_member_role(user) in RoomMembership.ADMIN_ROLES
     
     def is_member(self, user):
         """
@@ -97,7 +173,7 @@ class Room(models.Model):
         Returns:
             bool: True if user is a member of the room, False otherwise
         """
-        return RoomMembership.objects.filter(room=self, user=user).exists()
+        return self.get_member_role(user) is not None
     
     def can_access(self, user):
         """
@@ -124,9 +200,36 @@ class Room(models.Model):
             str: The user's role ('owner', 'admin', 'member') or None if not a member
         """
         if self.is_owner(user):
-            return 'owner'
-        membership = RoomMembership.objects.filter(room=self, user=user).first()
-        return membership.role if membership else None
+            return RoomMembership.OWNER
+        return self.get_member_role(user)
+    
+    def get_member_role(self, user):
+        """
+        Get the role stored on the user's membership in this room.
+        
+        Only the role column is fetched, and the result is cached on the room
+        instance so the permission helpers above share a single query per user.
+        If the room was loaded with memberships prefetched (see
+        RoomManager.with_members), no query is made at all.
+        
+        Args:
+            user (User): The user to get the membership role for
+            
+        Returns:
+            str: The membership role, or None if the user has no membership
+        """
+        cache = self.__dict__.setdefault('_member_role_cache', {})
+        if user.pk not in cache:
+            prefetched = getattr(self, '_prefetched_objects_cache', {}).get('memberships')
+            if prefetched is not None:
+                cache[user.pk] = next((m.role for m in prefetched if m.user_id == user.pk), None)
+            else:
+                cache[user.pk] = (
+                    RoomMembership.objects.filter(room=self, user=user)
+                    .values_list('role', flat=True)
+                    .first()
+                )
+        return cache[user.pk]
     
     def get_admins(self):
         """
@@ -135,10 +238,12 @@ class Room(models.Model):
         This includes both the owner and users with admin role.
         
         Returns:
-            list[User]: List of User objects with admin privileges
+            QuerySet[User]: Users with admin privileges
         """
-        admin_memberships = self.memberships.filter(role__in=['admin', 'owner'])
-        return [membership.user for membership in admin_memberships]
+        return User.objects.filter(
+            room_memberships__room=self,
+            room_memberships__role__in=RoomMembership.ADMIN_ROLES,
+        )
     
     def get_members(self):
         """
@@ -147,26 +252,31 @@ class Room(models.Model):
         This excludes admins and owner, returning only users with 'member' role.
         
         Returns:
-            list[User]: List of User objects with member role only
+            QuerySet[User]: Users with the member role only
         """
-        member_memberships = self.memberships.filter(role='member')
-        return [membership.user for membership in member_memberships]
+        return User.objects.filter(
+            room_memberships__room=self,
+            room_memberships__role=RoomMembership.MEMBER,
+        )
     
     @staticmethod
     def generate_room_code():
         """
         Generate a unique 6-character alphanumeric room code.
         
-        The code consists of uppercase letters and digits. This method ensures
-        uniqueness by checking existing room codes in the database.
+        The code consists of uppercase letters and digits drawn from
+        ``os.urandom``, so codes are not predictable. Candidates are
+        generated in batches and checked against existing room codes with a
+        single query per batch, so a collision does not cost an extra round trip.
         
         Returns:
             str: A unique 6-character room code
         """
         while True:
-            code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-            if not Room.objects.filter(room_code=code).exists():
-                return code
+            candidates = {_random_room_code() for _ in range(ROOM_CODE_BATCH_SIZE)}
+            free = candidates - Room.objects.existing_codes(candidates)
+            if free:
+                return free.pop()
 
 
 class RoomMembership(models.Model):
@@ -194,21 +304,40 @@ class RoomMembership(models.Model):
         is_admin(): Check if this membership represents an admin
         can_promote_demote(target): Check if can promote/demote target membership
     """
+    MEMBER = 'member'
+    ADMIN = 'admin'
+    OWNER = 'owner'  # Original creator - has highest privileges
+    
     ROLE_CHOICES = [
-        ('member', 'Member'),
-        ('admin', 'Admin'),
-        ('owner', 'Owner'),  # Original creator - has highest privileges
+        (MEMBER, 'Member'),
+        (ADMIN, 'Admin'),
+        (OWNER, 'Owner'),
     ]
     
+    # Roles with admin privileges, as a set for constant-time membership tests
+    ADMIN_ROLES = frozenset({ADMIN, OWNER})
+    
+    # (actor role, target role) pairs allowed by can_promote_demote: the owner
+    # can manage anyone else, admins can only manage regular members
+    PROMOTE_DEMOTE_PAIRS = frozenset({
+        (OWNER, OWNER),
+        (OWNER, ADMIN),
+        (OWNER, MEMBER),
+        (ADMIN, MEMBER),
+    })
+    
     room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name="memberships")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="room_memberships")
-    role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='member')
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES, default=MEMBER)
     joined_at = models.DateTimeField(auto_now_add=True)
     promoted_at = models.DateTimeField(null=True, blank=True)  # When promoted to admin
     promoted_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="promoted_users")
     
     class Meta:
         unique_together = ('room', 'user')
+        indexes = [
+            models.Index(fields=['room', 'role']),
+        ]
         verbose_name = "Room Membership"
         verbose_name_plural = "Room Memberships"
         ordering = ['-joined_at']
@@ -223,7 +352,7 @@ class RoomMembership(models.Model):
         Returns:
             bool: True if this user is the room owner, False otherwise
         """
-        return self.role == 'owner'
+        return self.role == self.OWNER
     
     def is_admin(self):
         """
@@ -235,7 +364,7 @@ class RoomMembership(models.Model):
         Returns:
             bool: True if user has admin privileges or is owner, False otherwise
         """
-        return self.role in ['admin', 'owner']
+        return self.role in self.ADMIN_ROLES
     
     def can_promote_demote(self, target_membership):
         """
@@ -252,13 +381,9 @@ class RoomMembership(models.Model):
         Returns:
             bool: True if this user can promote/demote the target, False otherwise
         """
-        if self.role == 'owner':
-            # Owner can promote/demote anyone except themselves
-            return target_membership.user != self.user
-        elif self.role == 'admin':
-            # Admin can only promote/demote regular members
-            return target_membership.role == 'member'
-        return False
+        if target_membership.user_id == self.user_id:
+            return False
+        return (self.role, target_membership.role) in self.PROMOTE_DEMOTE_PAIRS
 
 
 class Announcement(models.Model):
@@ -273,23 +398,59 @@ class Announcement(models.Model):
         author (ForeignKey): The user who created this announcement
         title (CharField): Title of the announcement (max 200 chars)
         content (TextField): Main content/body of the announcement
+        like_count ... angry_count (PositiveIntegerField): Number of reactions
+            of each type, kept in sync by the AnnouncementReaction signal handlers
         created_at (DateTimeField): When the announcement was created
         updated_at (DateTimeField): When the announcement was last modified
+    
+    Methods:
+        get_reaction_count(reaction_type): Get the tally for one reaction type
+        total_reactions(): Get the number of reactions of any type
     """
     room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name="announcements")
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="announcements")
     title = models.CharField(max_length=200, verbose_name="Announcement Title")
     content = models.TextField(verbose_name="Announcement Content")
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    love_count = models.PositiveIntegerField(default=0, editable=False)
+    laugh_count = models.PositiveIntegerField(default=0, editable=False)
+    wow_count = models.PositiveIntegerField(default=0, editable=False)
+    sad_count = models.PositiveIntegerField(default=0, editable=False)
+    angry_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
+        indexes = [
+            models.Index(fields=['room', '-created_at']),
+        ]
         verbose_name = "Announcement"
         verbose_name_plural = "Announcements"
         ordering = ['-created_at']
     
     def __str__(self):
         return f"{self.title} - {self.room.room_name}"
+    
+    def get_reaction_count(self, reaction_type):
+        """
+        Get the number of reactions of the given type.
+        
+        Args:
+            reaction_type (str): A key from AnnouncementReaction.REACTION_CHOICES
+            
+        Returns:
+            int: The stored tally for that reaction type
+        """
+        return getattr(self, AnnouncementReaction.COUNT_FIELDS[reaction_type])
+    
+    def total_reactions(self):
+        """
+        Get the number of reactions of any type.
+        
+        Returns:
+            int: Sum of the per-type reaction tallies
+        """
+        return sum(getattr(self, field) for field in AnnouncementReaction.COUNT_FIELDS.values())
 
 
 class AnnouncementReaction(models.Model):
@@ -322,8 +483,14 @@ class AnnouncementReaction(models.Model):
         ('angry', '😠'),
     ]
     
+    # Announcement column holding the tally for each reaction type
+    COUNT_FIELDS = {reaction_type: f'{reaction_type}_count' for reaction_type, _ in REACTION_CHOICES}
+    
     announcement = models.ForeignKey(Announcement, on_delete=models.CASCADE, related_name="reactions")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="announcement_reactions")
+    # Kept as the short string key: it is the value posted by the reaction
+    # buttons and returned in JSON, and per-type counts are read from the
+    # tallies on Announcement, so no hot query groups or sorts by this column.
     reaction_type = models.CharField(max_length=10, choices=REACTION_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True)
     
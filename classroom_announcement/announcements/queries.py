@@ -0,0 +1,34 @@
+"""
+Query expression helpers for the Classroom Announcement Application.
+
+Functions:
+    count_subquery(queryset, group_field): Correlated COUNT(*) subquery
+"""
+
+from django.db.models import Count, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, group_field):
+    """
+    Build a correlated COUNT(*) subquery grouped on ``group_field``.
+
+    The queryset is expected to filter on an ``OuterRef`` so each outer row
+    gets its own count; rows without matches count as 0 instead of NULL.
+
+    Args:
+        queryset (QuerySet): Rows to count, correlated with the outer query
+        group_field (str): Field the rows are grouped on (the correlated one)
+
+    Returns:
+        Coalesce: Expression usable in annotate() or update()
+    """
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values(group_field)
+            .annotate(count=Count('pk'))
+            .values('count')
+        ),
+        0,
+    )
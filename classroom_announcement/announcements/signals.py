@@ -0,0 +1,207 @@
+"""
+Signal handlers for the Classroom Announcement Application.
+
+This module keeps denormalized counters in sync with the rows they count,
+so list pages can read them directly instead of aggregating on every load,
+and drops cached dashboard contexts (see caching.py) that a write affects.
+
+Handlers:
+    membership_created: Increment Room.member_count for a new membership
+    membership_deleted: Decrement Room.member_count for a removed membership
+    reaction_remember_previous_type: Record a reaction's stored type before saving
+    reaction_saved: Adjust Announcement reaction tallies for a new or changed reaction
+    reaction_deleted: Decrement Announcement reaction tallies for a removed reaction
+    room_remember_users: Record who sees a room before it and its rows are deleted
+    announcement_remember_users: Record who sees an announcement before it is deleted
+    room_changed: Invalidate dashboards of everyone in a saved or deleted room
+    membership_changed: Invalidate dashboards of everyone in the membership's room
+    announcement_changed: Invalidate dashboards of everyone in the announcement's room
+    reaction_changed: Invalidate the reacting user's dashboards
+    announcement_list_changed: Bump the room's announcement list version
+    reaction_list_changed: Bump the announcement's room's announcement list version
+
+Notes:
+    Counters are updated with F() expressions, so concurrent requests cannot
+    overwrite each other's changes. Bulk operations that bypass signals
+    (QuerySet.update, bulk_create, raw deletes) must adjust the counters
+    themselves. The reconcile_counters management command recomputes every
+    counter from the source tables if they ever drift.
+
+    When a room or announcement is deleted, Django deletes its memberships,
+    announcements and reactions through the collector and sends post_delete
+    for each of them. The per-row handlers skip those cascaded rows (their
+    counters and cached lists belong to the parent being deleted); the
+    parent's own handlers invalidate everything once instead, using the user
+    IDs recorded in pre_delete before the child rows disappear.
+"""
+
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .caching import bump_announcements_version, invalidate_dashboards, room_user_ids
+from .models import Announcement, AnnouncementReaction, Room, RoomMembership
+
+
+def _cascaded_from(kwargs, *models):
+    """
+    Check whether a delete signal was caused by deleting one of ``models``.
+
+    Args:
+        kwargs (dict): Keyword arguments of a pre_delete/post_delete signal
+        *models: Parent model classes whose deletion the row was collected for
+
+    Returns:
+        bool: True if the delete() call was made on an instance or queryset
+            of one of the given models
+    """
+    origin = kwargs.get('origin')
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model in models
+
+
+@receiver(post_save, sender=RoomMembership)
+def membership_created(sender, instance, created, **kwargs):
+    """Increment the room's member count when a membership is created."""
+    if created:
+        Room.objects.filter(pk=instance.room_id).update(member_count=F('member_count') + 1)
+
+
+@receiver(post_delete, sender=RoomMembership)
+def membership_deleted(sender, instance, **kwargs):
+    """Decrement the room's member count when a membership is deleted."""
+    if _cascaded_from(kwargs, Room):
+        return
+    Room.objects.filter(pk=instance.room_id, member_count__gt=0).update(member_count=F('member_count') - 1)
+
+
+@receiver(pre_save, sender=AnnouncementReaction)
+def reaction_remember_previous_type(sender, instance, **kwargs):
+    """Record the stored reaction type so a type change can move the tally."""
+    if instance._state.adding:
+        instance._previous_reaction_type = None
+    else:
+        instance._previous_reaction_type = (
+            AnnouncementReaction.objects.filter(pk=instance.pk)
+            .values_list('reaction_type', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=AnnouncementReaction)
+def reaction_saved(sender, instance, created, **kwargs):
+    """Move the announcement's reaction tallies to match the saved reaction."""
+    previous_type = None if created else getattr(instance, '_previous_reaction_type', None)
+    if previous_type == instance.reaction_type:
+        return
+    changes = {}
+    old_field = AnnouncementReaction.COUNT_FIELDS.get(previous_type)
+    new_field = AnnouncementReaction.COUNT_FIELDS.get(instance.reaction_type)
+    if old_field:
+        changes[old_field] = F(old_field) - 1
+    if new_field:
+        changes[new_field] = F(new_field) + 1
+    if changes:
+        Announcement.objects.filter(pk=instance.announcement_id).update(**changes)
+
+
+@receiver(post_delete, sender=AnnouncementReaction)
+def reaction_deleted(sender, instance, **kwargs):
+    """Decrement the announcement's tally for the deleted reaction's type."""
+    if _cascaded_from(kwargs, Room, Announcement):
+        return
+    field = AnnouncementReaction.COUNT_FIELDS.get(instance.reaction_type)
+    if field:
+        Announcement.objects.filter(pk=instance.announcement_id, **{f'{field}__gt': 0}).update(**{field: F(field) - 1})
+
+
+@receiver(pre_delete, sender=Room)
+def room_remember_users(sender, instance, **kwargs):
+    """Record everyone whose dashboard counts the room's rows, before they go."""
+    instance._dashboard_user_ids = (
+        room_user_ids(instance.pk)
+        | set(Announcement.objects.filter(room_id=instance.pk).values_list('author_id', flat=True))
+        | set(
+            AnnouncementReaction.objects.filter(announcement__room_id=instance.pk)
+            .values_list('user_id', flat=True)
+        )
+    )
+
+
+@receiver(pre_delete, sender=Announcement)
+def announcement_remember_users(sender, instance, **kwargs):
+    """Record everyone whose dashboard counts the announcement or its reactions."""
+    if _cascaded_from(kwargs, Room):
+        return
+    instance._dashboard_user_ids = (
+        room_user_ids(instance.room_id)
+        | {instance.author_id}
+        | set(instance.reactions.values_list('user_id', flat=True))
+    )
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def room_changed(sender, instance, **kwargs):
+    """Invalidate the dashboards of the room's owner and members."""
+    user_ids = getattr(instance, '_dashboard_user_ids', None)
+    if user_ids is None:
+        user_ids = room_user_ids(instance.pk)
+    invalidate_dashboards(user_ids | {instance.created_by_id})
+
+
+@receiver(post_save, sender=RoomMembership)
+@receiver(post_delete, sender=RoomMembership)
+def membership_changed(sender, instance, **kwargs):
+    """Invalidate the dashboards of the member and everyone else in the room."""
+    if _cascaded_from(kwargs, Room):
+        return
+    invalidate_dashboards(room_user_ids(instance.room_id) | {instance.user_id})
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def announcement_changed(sender, instance, **kwargs):
+    """Invalidate the dashboards of the author and everyone in the room."""
+    if _cascaded_from(kwargs, Room):
+        return
+    user_ids = getattr(instance, '_dashboard_user_ids', None)
+    if user_ids is None:
+        user_ids = room_user_ids(instance.room_id) | {instance.author_id}
+    invalidate_dashboards(user_ids)
+
+
+@receiver(post_save, sender=AnnouncementReaction)
+@receiver(post_delete, sender=AnnouncementReaction)
+def reaction_changed(sender, instance, **kwargs):
+    """Invalidate the dashboards of the user who reacted."""
+    if _cascaded_from(kwargs, Room, Announcement):
+        return
+    invalidate_dashboards([instance.user_id])
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def announcement_list_changed(sender, instance, **kwargs):
+    """Expire the cached announcement list of the announcement's room."""
+    if _cascaded_from(kwargs, Room):
+        return
+    bump_announcements_version(instance.room_id)
+
+
+@receiver(post_save, sender=AnnouncementReaction)
+@receiver(post_delete, sender=AnnouncementReaction)
+def reaction_list_changed(sender, instance, **kwargs):
+    """Expire the cached announcement list that shows the reaction's tallies."""
+    if _cascaded_from(kwargs, Room, Announcement):
+        return
+    if AnnouncementReaction.announcement.is_cached(instance):
+        room_id = instance.announcement.room_id
+    else:
+        room_id = (
+            Announcement.objects.filter(pk=instance.announcement_id)
+            .values_list('room_id', flat=True)
+            .first()
+        )
+    if room_id is not None:
+        bump_announcements_version(room_id)
@@ -0,0 +1,48 @@
+"""
+Template tags for announcement reactions.
+
+Tags:
+    reaction_buttons: Render the reaction buttons of an announcement
+"""
+
+from django import template
+
+from ..models import AnnouncementReaction
+
+register = template.Library()
+
+
+@register.inclusion_tag('announcements/reaction_buttons.html', takes_context=True)
+def reaction_buttons(context, announcement, user_reactions):
+    """
+    Render one toggle form per reaction type for an announcement.
+
+    Counts come from the tallies stored on the announcement, so rendering
+    the buttons makes no queries of its own.
+
+    Usage:
+        {% load reaction_tags %}
+        {% reaction_buttons announcement user_reactions %}
+
+    Args:
+        context (Context): The calling template's context (for the CSRF token)
+        announcement (Announcement): The announcement to render buttons for
+        user_reactions (dict): Current user's reaction type keyed by announcement ID
+
+    Returns:
+        dict: Context for the reaction_buttons.html template
+    """
+    active_type = user_reactions.get(announcement.id)
+    return {
+        'announcement': announcement,
+        'csrf_token': context.get('csrf_token'),
+        'reactions': [
+            {
+                'type': reaction_type,
+                'emoji': emoji,
+                'count': announcement.get_reaction_count(reaction_type),
+                'is_active': reaction_type == active_type,
+            }
+            for reaction_type, emoji in AnnouncementReaction.REACTION_CHOICES
+        ],
+    }
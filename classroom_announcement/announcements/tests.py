@@ -1,3 +1,540 @@
+import io
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .caching import account_cache_key, get_announcements_version, home_cache_key
+from .models import Announcement, AnnouncementReaction, Room, RoomMembership
+
+
+def _make_room(owner, code, members=0, announcements=0):
+    """
+    Create a room with members and announcements, as the views would.
+
+    Like create_room, the owner gets no membership row.
+
+    Every member reacts to every announcement, so the room has
+    ``members * announcements`` reactions.
+    """
+    room = Room.objects.create(room_name=f'Room {code}', room_code=code, created_by=owner)
+    users = [
+        User.objects.create(username=f'{code.lower()}-member-{i}')
+        for i in range(members)
+    ]
+    for user in users:
+        RoomMembership.objects.create(room=room, user=user, role=RoomMembership.MEMBER)
+    for i in range(announcements):
+        announcement = Announcement.objects.create(room=room, author=owner, title=f'A{i}', content='Body')
+        for user in users:
+            AnnouncementReaction.objects.create(announcement=announcement, user=user, reaction_type='like')
+    return room
+
+
+def _count_queries(func):
+    """Run ``func`` and return the number of queries it made."""
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return len(queries)
+
+
+class CascadeDeleteQueryCountTests(TestCase):
+    """Deleting a parent row must not run per-child signal work."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+
+    def test_room_delete_query_count_does_not_grow_with_room_size(self):
+        small = _make_room(self.owner, 'SMALL1', members=2, announcements=1)
+        large = _make_room(self.owner, 'LARGE1', members=50, announcements=3)
+
+        small_queries = _count_queries(small.delete)
+        large_queries = _count_queries(large.delete)
+
+        # The collector deletes rows in batches of 100, so the 150 reactions
+        # take one extra DELETE; nothing else may depend on the room's size.
+        self.assertLessEqual(large_queries - small_queries, 1)
+        self.assertLessEqual(large_queries, 15)
+        self.assertFalse(AnnouncementReaction.objects.exists())
+        self.assertFalse(RoomMembership.objects.exists())
+
+    def test_announcement_delete_query_count_does_not_grow_with_reactions(self):
+        room = _make_room(self.owner, 'ROOM01', members=50, announcements=2)
+        few, many = room.announcements.all()
+        few.reactions.exclude(pk__in=few.reactions.values('pk')[:2]).delete()
+
+        few_queries = _count_queries(few.delete)
+        many_queries = _count_queries(many.delete)
+
+        self.assertEqual(few_queries, many_queries)
+        self.assertLessEqual(many_queries, 12)
+        self.assertFalse(AnnouncementReaction.objects.exists())
+
+    def test_room_delete_invalidates_dashboards_of_everyone_involved(self):
+        room = _make_room(self.owner, 'ROOM01', members=2, announcements=1)
+        user_ids = set(AnnouncementReaction.objects.values_list('user_id', flat=True)) | {self.owner.pk}
+        for user_id in user_ids:
+            cache.set(f'announcements:home:{user_id}', {'stale': True})
+
+        room.delete()
+
+        for user_id in user_ids:
+            self.assertIsNone(cache.get(f'announcements:home:{user_id}'))
+
+
+class DeleteRoomViewTests(TestCase):
+    """The delete_room view relies on the cascade signal handling above."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.client.force_login(self.owner)
+
+    def test_delete_room_query_count_does_not_grow_with_room_size(self):
+        small = _make_room(self.owner, 'SMALL1', members=2, announcements=1)
+        large = _make_room(self.owner, 'LARGE1', members=40, announcements=2)
+
+        small_queries = _count_queries(lambda: self.client.get(f'/rooms/{small.pk}/delete/'))
+        large_queries = _count_queries(lambda: self.client.get(f'/rooms/{large.pk}/delete/'))
+
+        self.assertEqual(small_queries, large_queries)
+        self.assertFalse(Room.objects.exists())
+        self.assertFalse(Announcement.objects.exists())
+
+
+class DeleteAnnouncementViewTests(TestCase):
+    """delete_announcement must not pay per reaction."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.client.force_login(self.owner)
+
+    def test_delete_announcement_query_count_does_not_grow_with_reactions(self):
+        room = _make_room(self.owner, 'ROOM01', members=50, announcements=2)
+        few, many = room.announcements.all()
+        few.reactions.exclude(pk__in=few.reactions.values('pk')[:2]).delete()
+
+        few_queries = _count_queries(lambda: self.client.get(reverse('delete_announcement', args=[few.pk])))
+        many_queries = _count_queries(lambda: self.client.get(reverse('delete_announcement', args=[many.pk])))
+
+        self.assertEqual(few_queries, many_queries)
+        self.assertFalse(Announcement.objects.exists())
+
+
+class CounterSignalTests(TestCase):
+    """Room.member_count and the Announcement tallies follow their rows."""
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner')
+        self.user = User.objects.create(username='user')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        self.announcement = Announcement.objects.create(room=self.room, author=self.owner, title='A', content='B')
+
+    def test_member_count_follows_memberships(self):
+        membership = RoomMembership.objects.create(room=self.room, user=self.user)
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.member_count, 1)
+
+        membership.delete()
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.member_count, 0)
+
+    def test_reaction_tallies_follow_create_type_change_and_delete(self):
+        reaction = AnnouncementReaction.objects.create(
+            announcement=self.announcement, user=self.user, reaction_type='like'
+        )
+        self.announcement.refresh_from_db()
+        self.assertEqual((self.announcement.like_count, self.announcement.love_count), (1, 0))
+
+        reaction.reaction_type = 'love'
+        reaction.save()
+        self.announcement.refresh_from_db()
+        self.assertEqual((self.announcement.like_count, self.announcement.love_count), (0, 1))
+        self.assertEqual(self.announcement.total_reactions(), 1)
+
+        reaction.save()
+        self.announcement.refresh_from_db()
+        self.assertEqual(self.announcement.love_count, 1)
+
+        reaction.delete()
+        self.announcement.refresh_from_db()
+        self.assertEqual(self.announcement.total_reactions(), 0)
+
+    def test_reconcile_counters_repairs_drift(self):
+        RoomMembership.objects.create(room=self.room, user=self.user)
+        AnnouncementReaction.objects.create(announcement=self.announcement, user=self.user, reaction_type='wow')
+        Room.objects.update(member_count=7)
+        Announcement.objects.update(wow_count=0, sad_count=3)
+
+        call_command('reconcile_counters', stdout=io.StringIO())
+
+        self.room.refresh_from_db()
+        self.announcement.refresh_from_db()
+        self.assertEqual(self.room.member_count, 1)
+        self.assertEqual((self.announcement.wow_count, self.announcement.sad_count), (1, 0))
+
+
+class _ConcurrentWrite:
+    """
+    Stand-in for the views' ``transaction`` module.
+
+    Runs ``write`` just before the view opens its transaction, as if another
+    request had committed it while this one was on its way to the row lock.
+    """
+
+    def __init__(self, write):
+        self.write = write
+
+    def atomic(self, *args, **kwargs):
+        self.write()
+        return transaction.atomic(*args, **kwargs)
+
+
+class ConcurrentDeleteTests(TestCase):
+    """A row another request already deleted is not deleted and counted again."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.member = User.objects.create(username='member')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        self.membership = RoomMembership.objects.create(room=self.room, user=self.member)
+        RoomMembership.objects.create(room=self.room, user=User.objects.create(username='other'))
+        self.announcement = Announcement.objects.create(room=self.room, author=self.owner, title='A', content='B')
+        self.client.force_login(self.member)
+
+    def test_leave_after_concurrent_kick_decrements_once(self):
+        kick = _ConcurrentWrite(lambda: RoomMembership.objects.filter(pk=self.membership.pk).delete())
+
+        with mock.patch('announcements.views.transaction', kick):
+            response = self.client.post(reverse('room_detail', args=[self.room.pk]), {'leave_room': ''})
+
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.member_count, 1)
+
+    def test_toggle_after_concurrent_removal_keeps_tallies_in_step(self):
+        AnnouncementReaction.objects.create(announcement=self.announcement, user=self.member, reaction_type='like')
+        removal = _ConcurrentWrite(lambda: AnnouncementReaction.objects.filter(user=self.member).delete())
+
+        with mock.patch('announcements.views.transaction', removal):
+            self.client.post(
+                reverse('toggle_reaction', args=[self.announcement.pk]),
+                {'reaction_type': 'like'},
+                HTTP_ACCEPT='application/json',
+            )
+
+        self.announcement.refresh_from_db()
+        self.assertEqual(self.announcement.like_count, AnnouncementReaction.objects.count())
+
+
+class CacheInvalidationTests(TestCase):
+    """Writes drop the cached dashboards they affect."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.member = User.objects.create(username='member')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        RoomMembership.objects.create(room=self.room, user=self.member)
+
+    def _fill_dashboards(self):
+        for user in (self.owner, self.member):
+            cache.set(home_cache_key(user.pk), {'stale': True})
+            cache.set(account_cache_key(user.pk), {'stale': True})
+
+    def _assert_dashboards_dropped(self):
+        for user in (self.owner, self.member):
+            self.assertIsNone(cache.get(home_cache_key(user.pk)))
+            self.assertIsNone(cache.get(account_cache_key(user.pk)))
+
+    def test_home_is_served_from_cache_until_a_room_changes(self):
+        self.client.force_login(self.owner)
+        self.client.get(reverse('home'))
+        self.assertIsNotNone(cache.get(home_cache_key(self.owner.pk)))
+
+        Room.objects.create(room_name='Other', room_code='ROOM02', created_by=self.owner)
+
+        self.assertIsNone(cache.get(home_cache_key(self.owner.pk)))
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, 'Other')
+
+    def test_new_announcement_drops_dashboards_of_the_room(self):
+        self._fill_dashboards()
+        Announcement.objects.create(room=self.room, author=self.owner, title='A', content='B')
+        self._assert_dashboards_dropped()
+
+    def test_membership_change_drops_dashboards_of_the_room(self):
+        self._fill_dashboards()
+        RoomMembership.objects.filter(user=self.member).get().delete()
+        self._assert_dashboards_dropped()
+
+
+class AnnouncementListCacheTests(TestCase):
+    """The room page's cached announcement list follows its rows."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.member = User.objects.create(username='member')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        RoomMembership.objects.create(room=self.room, user=self.member)
+        self.url = reverse('room_detail', args=[self.room.pk])
+
+    def test_reaction_bumps_the_announcement_list_version(self):
+        announcement = Announcement.objects.create(room=self.room, author=self.owner, title='A', content='B')
+        version = get_announcements_version(self.room.pk)
+
+        AnnouncementReaction.objects.create(announcement=announcement, user=self.member, reaction_type='like')
+
+        self.assertNotEqual(get_announcements_version(self.room.pk), version)
+
+    def test_cached_room_page_shows_new_announcement(self):
+        self.client.force_login(self.member)
+        self.client.get(self.url)
+        Announcement.objects.create(room=self.room, author=self.owner, title='Fresh news', content='B')
+
+        response = self.client.get(self.url)
+
+        self.assertContains(response, 'Fresh news')
+
+    def test_cached_announcement_list_skips_its_queries(self):
+        Announcement.objects.create(room=self.room, author=self.owner, title='A', content='B')
+        self.client.force_login(self.owner)
+
+        first = _count_queries(lambda: self.client.get(self.url))
+        cached = _count_queries(lambda: self.client.get(self.url))
+
+        self.assertEqual(first - cached, 2)
+
+
+class ToggleReactionTests(TestCase):
+    """toggle_reaction's JSON, form, 403 and 405 contract."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.member = User.objects.create(username='member')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        RoomMembership.objects.create(room=self.room, user=self.member)
+        self.announcement = Announcement.objects.create(room=self.room, author=self.owner, title='A', content='B')
+        self.url = reverse('toggle_reaction', args=[self.announcement.pk])
+        self.client.force_login(self.member)
+
+    def _toggle(self, reaction_type):
+        return self.client.post(self.url, {'reaction_type': reaction_type}, HTTP_ACCEPT='application/json')
+
+    def test_add_change_and_remove(self):
+        data = self._toggle('like').json()
+        self.assertEqual(data['user_reaction'], 'like')
+        self.assertEqual(data['reaction_counts']['like'], 1)
+
+        data = self._toggle('love').json()
+        self.assertEqual(data['user_reaction'], 'love')
+        self.assertEqual((data['reaction_counts']['like'], data['reaction_counts']['love']), (0, 1))
+
+        data = self._toggle('love').json()
+        self.assertIsNone(data['user_reaction'])
+        self.assertEqual(sum(data['reaction_counts'].values()), 0)
+        self.assertFalse(AnnouncementReaction.objects.exists())
+
+    def test_invalid_type_is_400(self):
+        response = self._toggle('bogus')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+    def test_outsider_gets_403_json(self):
+        self.client.force_login(User.objects.create(username='outsider'))
+        response = self._toggle('like')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json(), {'success': False, 'error': 'forbidden'})
+        self.assertFalse(AnnouncementReaction.objects.exists())
+
+    def test_get_is_405(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+    def test_plain_form_post_redirects_to_room(self):
+        response = self.client.post(self.url, {'reaction_type': 'like'})
+        self.assertRedirects(
+            response, reverse('room_detail', args=[self.room.pk]), fetch_redirect_response=False
+        )
+        self.assertEqual(AnnouncementReaction.objects.get().reaction_type, 'like')
+
+
+class RequireRoomRoleTests(TestCase):
+    """Owner-only and admin views refuse everyone below the required role."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.admin = User.objects.create(username='admin')
+        self.member = User.objects.create(username='member')
+        self.other = User.objects.create(username='other')
+        self.outsider = User.objects.create(username='outsider')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        RoomMembership.objects.create(room=self.room, user=self.admin, role=RoomMembership.ADMIN)
+        RoomMembership.objects.create(room=self.room, user=self.member, role=RoomMembership.MEMBER)
+        RoomMembership.objects.create(room=self.room, user=self.other, role=RoomMembership.MEMBER)
+        self.room_url = reverse('room_detail', args=[self.room.pk])
+
+    def _get_as(self, user, name, *args):
+        self.client.force_login(user)
+        return self.client.get(reverse(name, args=[self.room.pk, *args]))
+
+    def _messages(self, response):
+        return [str(message) for message in get_messages(response.wsgi_request)]
+
+    def test_owner_only_views_refuse_admins_members_and_outsiders(self):
+        for user in (self.admin, self.member, self.outsider):
+            response = self._get_as(user, 'promote_user', self.member.pk)
+            self.assertRedirects(response, self.room_url, fetch_redirect_response=False)
+            self.assertIn("Only the room owner can promote users to admin.", self._messages(response))
+
+            response = self._get_as(user, 'demote_user', self.admin.pk)
+            self.assertIn("Only the room owner can demote administrators.", self._messages(response))
+
+            response = self._get_as(user, 'delete_room')
+            self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+
+        self.assertTrue(Room.objects.filter(pk=self.room.pk).exists())
+        roles = dict(RoomMembership.objects.values_list('user_id', 'role'))
+        self.assertEqual(roles[self.member.pk], RoomMembership.MEMBER)
+        self.assertEqual(roles[self.admin.pk], RoomMembership.ADMIN)
+
+    def test_owner_role_membership_does_not_make_its_user_the_owner(self):
+        RoomMembership.objects.filter(user=self.admin).update(role=RoomMembership.OWNER)
+
+        response = self._get_as(self.admin, 'promote_user', self.member.pk)
+        self.assertIn("Only the room owner can promote users to admin.", self._messages(response))
+
+        response = self._get_as(self.admin, 'demote_user', self.other.pk)
+        self.assertIn("Only the room owner can demote administrators.", self._messages(response))
+
+        response = self._get_as(self.admin, 'delete_room')
+        self.assertIn("Only the room owner can delete this room.", self._messages(response))
+
+        self.assertTrue(Room.objects.filter(pk=self.room.pk).exists())
+        self.assertEqual(RoomMembership.objects.get(user=self.member).role, RoomMembership.MEMBER)
+
+    def test_kick_member_refuses_members_and_outsiders(self):
+        for user in (self.member, self.outsider):
+            response = self._get_as(user, 'kick_member', self.other.pk)
+            self.assertIn("You don't have permission to remove members.", self._messages(response))
+        self.assertTrue(RoomMembership.objects.filter(user=self.other).exists())
+
+    def test_admin_can_kick_members_but_not_admins(self):
+        response = self._get_as(self.admin, 'kick_member', self.other.pk)
+        self.assertFalse(RoomMembership.objects.filter(user=self.other).exists())
+
+        second_admin = User.objects.create(username='admin2')
+        RoomMembership.objects.create(room=self.room, user=second_admin, role=RoomMembership.ADMIN)
+        response = self._get_as(self.admin, 'kick_member', second_admin.pk)
+        self.assertIn("Only the room owner can remove administrators.", self._messages(response))
+        self.assertTrue(RoomMembership.objects.filter(user=second_admin).exists())
+
+    def test_owner_can_kick_admins_but_not_themselves(self):
+        self._get_as(self.owner, 'kick_member', self.admin.pk)
+        self.assertFalse(RoomMembership.objects.filter(user=self.admin).exists())
+
+        response = self._get_as(self.owner, 'kick_member', self.owner.pk)
+        self.assertEqual(response.status_code, 404)
+
+    def test_owner_can_delete_room(self):
+        response = self._get_as(self.owner, 'delete_room')
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+        self.assertFalse(Room.objects.exists())
+
+    def test_missing_room_is_404(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(reverse('promote_user', args=[self.room.pk + 1, self.member.pk]))
+        self.assertEqual(response.status_code, 404)
+
+
+class PromoteDemoteTests(TestCase):
+    """Promotion and demotion are guarded single UPDATEs."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.member = User.objects.create(username='member')
+        self.room = Room.objects.create(room_name='Room', room_code='ROOM01', created_by=self.owner)
+        self.membership = RoomMembership.objects.create(room=self.room, user=self.member)
+        self.client.force_login(self.owner)
+
+    def _get(self, name, user_id):
+        return self.client.get(reverse(name, args=[self.room.pk, user_id]))
+
+    def _messages(self, response):
+        return [str(message) for message in get_messages(response.wsgi_request)]
+
+    def test_promote_then_demote(self):
+        cache.set(account_cache_key(self.member.pk), {'stale': True})
+
+        response = self._get('promote_user', self.member.pk)
+
+        self.membership.refresh_from_db()
+        self.assertEqual(self.membership.role, RoomMembership.ADMIN)
+        self.assertEqual(self.membership.promoted_by, self.owner)
+        self.assertIsNotNone(self.membership.promoted_at)
+        self.assertIn("member has been promoted to admin.", self._messages(response))
+        self.assertIsNone(cache.get(account_cache_key(self.member.pk)))
+
+        response = self._get('demote_user', self.member.pk)
+
+        self.membership.refresh_from_db()
+        self.assertEqual(self.membership.role, RoomMembership.MEMBER)
+        self.assertIsNone(self.membership.promoted_by)
+        self.assertIsNone(self.membership.promoted_at)
+        self.assertIn("member has been demoted to member.", self._messages(response))
+
+    def test_promote_admin_is_refused(self):
+        RoomMembership.objects.filter(pk=self.membership.pk).update(role=RoomMembership.ADMIN)
+        response = self._get('promote_user', self.member.pk)
+        self.assertIn("member is already an admin or owner.", self._messages(response))
+
+    def test_demote_member_is_refused(self):
+        response = self._get('demote_user', self.member.pk)
+        self.assertIn("member is not an admin.", self._messages(response))
+
+    def test_demote_owner_role_is_refused(self):
+        RoomMembership.objects.filter(pk=self.membership.pk).update(role=RoomMembership.OWNER)
+        response = self._get('demote_user', self.member.pk)
+        self.assertIn("The room owner cannot be demoted.", self._messages(response))
+        self.membership.refresh_from_db()
+        self.assertEqual(self.membership.role, RoomMembership.OWNER)
+
+    def test_unknown_user_is_404(self):
+        self.assertEqual(self._get('promote_user', self.member.pk + 100).status_code, 404)
+        self.assertEqual(self._get('demote_user', self.member.pk + 100).status_code, 404)
+
+    def test_promote_is_a_single_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            self._get('promote_user', self.member.pk)
+        updates = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "announcements_roommembership"')]
+        self.assertEqual(len(updates), 1)
+
+
+class RoomDetailQueryCountTests(TestCase):
+    """The room page's query count does not depend on its size."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username='owner')
+        self.client.force_login(self.owner)
+
+    def test_room_detail_query_count_does_not_grow_with_room_size(self):
+        small = _make_room(self.owner, 'SMALL1', members=2, announcements=1)
+        large = _make_room(self.owner, 'LARGE1', members=30, announcements=3)
+
+        small_queries = _count_queries(lambda: self.client.get(reverse('room_detail', args=[small.pk])))
+        large_queries = _count_queries(lambda: self.client.get(reverse('room_detail', args=[large.pk])))
 
-# Create your tests here.
+        self.assertEqual(small_queries, large_queries)
@@ -18,12 +18,33 @@ Dependencies:
     - Models for data persistence
 """
 
+import functools
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout as auth_logout, authenticate
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.models import User
 from django.contrib import messages
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.template.loader import render_to_string
+from django.utils.functional import SimpleLazyObject
+from django.views.decorators.http import require_POST
+from django.db import transaction
+from django.db.models import Count, OuterRef
 from .forms import CustomSignUpForm, CustomSignInForm, RoomCreationForm, JoinRoomForm, AnnouncementForm, RoomEditForm
 from .models import Room, RoomMembership, Announcement, AnnouncementReaction
+from .decorators import require_room_role
+from .queries import count_subquery
+from .caching import (
+    ANNOUNCEMENT_LIST_CACHE_TIMEOUT, DASHBOARD_CACHE_TIMEOUT,
+    account_cache_key, get_announcements_version, home_cache_key,
+    invalidate_dashboards,
+)
+
+
+# Reaction emoji looked up by reaction type
+_REACTION_EMOJI = dict(AnnouncementReaction.REACTION_CHOICES)
 
 
 def landing_page(request):
@@ -39,7 +60,21 @@ def landing_page(request):
     Returns:
         HttpResponse: Rendered landing page template
     """
-    return render(request, 'announcements/landing-page.html')
+    return HttpResponse(_landing_page_html())
+
+
+@functools.lru_cache(maxsize=None)
+def _landing_page_html():
+    """
+    Render the landing page once per process.
+    
+    The page has no per-request content (no user, messages or CSRF token),
+    so every visitor can be served the same markup without re-rendering.
+    
+    Returns:
+        str: The rendered landing page
+    """
+    return render_to_string('announcements/landing-page.html')
 
 
 def signUp(request):
@@ -116,21 +151,48 @@ def home(request):
     Context:
         user: Current authenticated user
         user_rooms: Rooms created by the user
-        member_rooms: Rooms where user is a member
-        has_rooms: Boolean indicating if user has any room associations
+        has_rooms: Boolean indicating if user owns or has joined any room
+        
+    Notes:
+        The room data is cached per user and invalidated by the model
+        signal handlers whenever the user's rooms or memberships change.
     """
-    # Get rooms where user is creator (owner)
-    user_rooms = Room.objects.filter(created_by=request.user)
-    # Get rooms where user is a member (including admin roles)
-    member_rooms = Room.objects.filter(memberships__user=request.user)
+    key = home_cache_key(request.user.id)
+    context = cache.get(key)
+    if context is None:
+        context = _build_home_context(request.user)
+        cache.set(key, context, DASHBOARD_CACHE_TIMEOUT)
     
-    context = {
-        'user': request.user,
+    return render(request, 'announcements/home.html', {'user': request.user, **context})
+
+
+# Room columns shown on the home and account room cards
+_ROOM_CARD_FIELDS = ('room_name', 'room_code', 'created_at')
+
+
+def _build_home_context(user):
+    """
+    Query the room data shown on the home dashboard.
+    
+    Args:
+        user (User): The user whose dashboard is being built
+        
+    Returns:
+        dict: Cacheable template context (without the user object)
+    """
+    # Get rooms where user is creator (owner). Evaluated once here so the
+    # has_rooms check below reuses the fetched rows instead of querying again.
+    # Only the columns the room cards render are loaded.
+    user_rooms = list(Room.objects.filter(created_by=user).only(*_ROOM_CARD_FIELDS))
+    
+    # Joined rooms are not listed on the dashboard, they only count towards
+    # has_rooms, so an EXISTS is enough (and only needed without owned rooms)
+    has_rooms = bool(user_rooms) or Room.objects.filter(memberships__user=user).exists()
+    
+    return {
         'user_rooms': user_rooms,
-        'member_rooms': member_rooms,
-        'has_rooms': user_rooms.exists() or member_rooms.exists(),
+        'has_rooms': has_rooms,
     }
-    return render(request, 'announcements/home.html', context)
 
 
 @login_required
@@ -157,22 +219,23 @@ def join_room(request):
     if request.method == "POST":
         form = JoinRoomForm(request.POST)
         if form.is_valid():
-            room_code = form.cleaned_data['room_code']
-            room = Room.objects.get(room_code=room_code)
+            room = form.room
             
             # Check if user is the owner
             if room.is_owner(request.user):
                 messages.info(request, "You are the owner of this room.")
                 return redirect('room_detail', room_id=room.id)
             
-            # Check if user is already a member
-            existing_membership = RoomMembership.objects.filter(room=room, user=request.user).first()
-            if existing_membership:
-                messages.info(request, f"You are already a {existing_membership.get_role_display().lower()} of this room.")
+            # Add user as member unless they already belong to the room.
+            # get_or_create relies on unique_together, so a double-submitted
+            # join cannot fail with an IntegrityError.
+            membership, created = RoomMembership.objects.get_or_create(
+                room=room, user=request.user, defaults={'role': RoomMembership.MEMBER}
+            )
+            if not created:
+                messages.info(request, f"You are already a {membership.get_role_display().lower()} of this room.")
                 return redirect('room_detail', room_id=room.id)
             
-            # Add user as member
-            RoomMembership.objects.create(room=room, user=request.user, role='member')
             messages.success(request, f"Successfully joined {room.room_name}!")
             return redirect('room_detail', room_id=room.id)
     
@@ -205,37 +268,50 @@ def room_detail(request, room_id):
         
     Context:
         room: Room object
-        announcements_with_reactions: List of announcements with reaction data
+        announcements: The room's announcements, rendered with reaction buttons
+        user_reactions: Current user's reaction type keyed by announcement ID
         user_role: Current user's role in the room
         is_owner: Boolean if user is room owner
         is_admin: Boolean if user is admin or owner
         owner_membership: RoomMembership object for room owner
-        admin_memberships: QuerySet of admin memberships
-        member_memberships: QuerySet of member memberships
+        admin_memberships: List of admin memberships
+        member_memberships: List of member memberships
         announcement_form: Form for creating new announcements
+        announcements_version: Version token keying the cached announcement list
     """
-    room = get_object_or_404(Room, id=room_id)
+    room = get_object_or_404(Room.objects.with_members(), id=room_id)
+    
+    # Organize the prefetched memberships by role in a single pass, picking
+    # out the current user's membership (used to leave the room) on the way
+    owner_membership = None
+    admin_memberships = []
+    member_memberships = []
+    current_user_membership = None
+    for membership in room.memberships.all():
+        if membership.role == RoomMembership.OWNER:
+            owner_membership = membership
+        elif membership.role == RoomMembership.ADMIN:
+            admin_memberships.append(membership)
+        elif membership.role == RoomMembership.MEMBER:
+            member_memberships.append(membership)
+        if membership.user_id == request.user.id:
+            current_user_membership = membership
+    
+    # Derive user role and permissions from the membership found above
+    is_owner = room.created_by_id == request.user.id
+    if is_owner:
+        user_role = RoomMembership.OWNER
+    else:
+        user_role = current_user_membership.role if current_user_membership else None
+    is_admin = is_owner or user_role in RoomMembership.ADMIN_ROLES
     
     # Check if user can access this room
-    if not room.can_access(request.user):
+    if user_role is None:
         messages.error(request, "You don't have permission to access this room.")
         return redirect('home')
     
-    # Get all announcements for this room
-    announcements = room.announcements.all()
-    
-    # Get user role and permissions
-    user_role = room.get_user_role(request.user)
-    is_owner = room.is_owner(request.user)
-    is_admin = room.is_admin(request.user)
-    
-    # Get room memberships organized by role
-    owner_membership = room.memberships.filter(role='owner').first()
-    admin_memberships = room.memberships.filter(role='admin')
-    member_memberships = room.memberships.filter(role='member')
-    
-    # Get current user's membership for role management
-    current_user_membership = room.memberships.filter(user=request.user).first()
+    # Get all announcements for this room (reaction tallies are stored on each row)
+    announcements = room.announcements.select_related('author')
     
     # Forms
     announcement_form = None
@@ -269,41 +345,28 @@ def room_detail(request, room_id):
         # Leave room (members and admins, but not owner)
         elif 'leave_room' in request.POST and not is_owner:
             if current_user_membership:
-                current_user_membership.delete()
+                # Re-read the membership under a row lock: a concurrent leave
+                # or kick may already have deleted it, and deleting it again
+                # would still fire post_delete and decrement member_count twice
+                with transaction.atomic():
+                    membership = RoomMembership.objects.select_for_update().filter(
+                        pk=current_user_membership.pk
+                    ).first()
+                    if membership is not None:
+                        membership.delete()
                 messages.success(request, f"You have left {room.room_name}.")
                 return redirect('home')
     
-    # Get user's reactions for this room's announcements and prepare reaction data
-    user_reactions = {}
-    announcements_with_reactions = []
-    
-    if announcements:
-        # Get user's specific reactions
-        reactions = AnnouncementReaction.objects.filter(
-            announcement__in=announcements, 
-            user=request.user
-        )
-        user_reactions = {r.announcement_id: r.reaction_type for r in reactions}
-        
-        # Prepare announcements with reaction data
-        for announcement in announcements:
-            reaction_data = []
-            for reaction_type, emoji in AnnouncementReaction.REACTION_CHOICES:
-                count = announcement.reactions.filter(reaction_type=reaction_type).count()
-                is_active = user_reactions.get(announcement.id) == reaction_type
-                reaction_data.append({
-                    'type': reaction_type,
-                    'emoji': emoji,
-                    'count': count,
-                    'is_active': is_active,
-                })
-            
-            announcement.reaction_data = reaction_data
-            announcements_with_reactions.append(announcement)
+    # Get user's reactions keyed by announcement. Like the announcements
+    # queryset, this is only evaluated when the cached list has to be re-rendered.
+    user_reactions = SimpleLazyObject(lambda: dict(
+        AnnouncementReaction.objects.filter(announcement__room=room, user=request.user)
+        .values_list('announcement_id', 'reaction_type')
+    ))
     
     context = {
         'room': room,
-        'announcements': announcements_with_reactions,
+        'announcements': announcements,
         'user_role': user_role,
         'is_owner': is_owner,
         'is_admin': is_admin,
@@ -314,6 +377,8 @@ def room_detail(request, room_id):
         'announcement_form': announcement_form,
         'room_edit_form': room_edit_form,
         'user_reactions': user_reactions,
+        'announcements_version': get_announcements_version(room.id),
+        'announcements_cache_timeout': ANNOUNCEMENT_LIST_CACHE_TIMEOUT,
     }
     return render(request, 'announcements/room_detail.html', context)
 
@@ -386,28 +451,65 @@ def account(request):
         joined_rooms: Rooms where user is a member (with role info)
         stats: Dictionary with user statistics
         recent_announcements: Latest announcements by the user
+        
+    Notes:
+        The statistics and activity are cached per user and invalidated by
+        the model signal handlers whenever any of the underlying rows change.
     """
     user = request.user
+    key = account_cache_key(user.id)
+    context = cache.get(key)
+    if context is None:
+        context = _build_account_context(user)
+        cache.set(key, context, DASHBOARD_CACHE_TIMEOUT)
     
-    # Get owned rooms
-    owned_rooms = Room.objects.filter(created_by=user).prefetch_related('memberships', 'announcements')
+    return render(request, 'announcements/account.html', {'user': user, **context})
+
+
+def _build_account_context(user):
+    """
+    Query the statistics and activity shown on the account page.
     
-    # Get joined rooms (as member or admin, not owner)
-    joined_rooms = RoomMembership.objects.filter(user=user).exclude(
-        room__created_by=user
-    ).select_related('room').prefetch_related('room__memberships', 'room__announcements')
+    Args:
+        user (User): The user whose account page is being built
+        
+    Returns:
+        dict: Cacheable template context (without the user object)
+    """
+    # Get owned rooms (member counts are stored on the room, announcements are counted here)
+    owned_rooms = list(
+        Room.objects.filter(created_by=user)
+        .only(*_ROOM_CARD_FIELDS, 'member_count')
+        .annotate(announcement_count=Count('announcements'))
+    )
     
-    # Calculate statistics
-    owned_rooms_count = owned_rooms.count()
-    joined_rooms_count = joined_rooms.count()
-    announcements_count = Announcement.objects.filter(author=user).count()
-    reactions_count = AnnouncementReaction.objects.filter(user=user).count()
+    # Get joined rooms (as member or admin, not owner)
+    joined_rooms = list(
+        RoomMembership.objects.filter(user=user).exclude(
+            room__created_by=user
+        ).select_related('room').only(
+            'role', 'joined_at', *(f'room__{field}' for field in (*_ROOM_CARD_FIELDS, 'member_count'))
+        ).annotate(room_announcement_count=Count('room__announcements'))
+    )
+    
+    # Calculate statistics (both lists are rendered anyway, so count them in Python)
+    owned_rooms_count = len(owned_rooms)
+    joined_rooms_count = len(joined_rooms)
+    # Authored announcements and given reactions are counted in one round-trip
+    totals = User.objects.filter(pk=user.pk).annotate(
+        announcements_count=count_subquery(Announcement.objects.filter(author=OuterRef('pk')), 'author'),
+        reactions_count=count_subquery(AnnouncementReaction.objects.filter(user=OuterRef('pk')), 'user'),
+    ).values('announcements_count', 'reactions_count').get()
+    announcements_count = totals['announcements_count']
+    reactions_count = totals['reactions_count']
     
     # Get recent activity
     recent_activity = []
     
     # Recent announcements created
-    recent_announcements = Announcement.objects.filter(author=user).order_by('-created_at')[:3]
+    recent_announcements = Announcement.objects.filter(author=user).select_related('room').only(
+        'title', 'created_at', 'room__room_name'
+    ).order_by('-created_at')[:3]
     for announcement in recent_announcements:
         recent_activity.append({
             'icon': '📢',
@@ -417,9 +519,11 @@ def account(request):
         })
     
     # Recent reactions given
-    recent_reactions = AnnouncementReaction.objects.filter(user=user).order_by('-created_at')[:3]
+    recent_reactions = AnnouncementReaction.objects.filter(user=user).select_related('announcement__room').only(
+        'reaction_type', 'created_at', 'announcement__title', 'announcement__room__room_name'
+    ).order_by('-created_at')[:3]
     for reaction in recent_reactions:
-        emoji = dict(AnnouncementReaction.REACTION_CHOICES)[reaction.reaction_type]
+        emoji = _REACTION_EMOJI[reaction.reaction_type]
         recent_activity.append({
             'icon': emoji,
             'title': f'Reacted to "{reaction.announcement.title}"',
@@ -428,9 +532,11 @@ def account(request):
         })
     
     # Recent room joins
-    recent_joins = RoomMembership.objects.filter(user=user).order_by('-joined_at')[:3]
+    recent_joins = RoomMembership.objects.filter(user=user).select_related('room').only(
+        'role', 'joined_at', 'room__room_name', 'room__created_by'
+    ).order_by('-joined_at')[:3]
     for membership in recent_joins:
-        if membership.room.created_by != user:  # Don't include owned rooms
+        if membership.room.created_by_id != user.id:  # Don't include owned rooms
             recent_activity.append({
                 'icon': '🚪',
                 'title': f'Joined "{membership.room.room_name}"',
@@ -439,7 +545,7 @@ def account(request):
             })
     
     # Recent rooms created
-    recent_rooms = owned_rooms.order_by('-created_at')[:2]
+    recent_rooms = owned_rooms[:2]  # Already ordered newest first
     for room in recent_rooms:
         recent_activity.append({
             'icon': '🏫',
@@ -452,8 +558,7 @@ def account(request):
     recent_activity.sort(key=lambda x: x['time'], reverse=True)
     recent_activity = recent_activity[:8]
     
-    context = {
-        'user': user,
+    return {
         'owned_rooms': owned_rooms,
         'joined_rooms': joined_rooms,
         'owned_rooms_count': owned_rooms_count,
@@ -462,11 +567,10 @@ def account(request):
         'reactions_count': reactions_count,
         'recent_activity': recent_activity,
     }
-    
-    return render(request, 'announcements/account.html', context)
 
 
 @login_required
+@require_POST
 def toggle_reaction(request, announcement_id):
     """
     Toggle user's reaction on an announcement.
@@ -485,6 +589,10 @@ def toggle_reaction(request, announcement_id):
     POST Parameters:
         reaction_type (str): Type of reaction ('like', 'love', 'laugh', etc.)
         
+    Plain form posts are redirected back to the room with a flash message;
+    requests sending ``Accept: application/json`` get the JSON below instead.
+    Users outside the room get a 403 JSON error and non-POST requests a 405.
+    
     Response Format:
         {
             'success': bool,
@@ -493,44 +601,82 @@ def toggle_reaction(request, announcement_id):
             'user_reaction': str or null
         }
     """
-    if request.method == "POST":
-        announcement = get_object_or_404(Announcement, id=announcement_id)
-        
-        # Check if user can access this room
-        if not announcement.room.can_access(request.user):
-            messages.error(request, "You don't have permission to react to this announcement.")
-            return redirect('home')
+    announcement = get_object_or_404(Announcement.objects.select_related('room'), id=announcement_id)
+    
+    # Check if user can access this room (answered directly; non-members
+    # never see the reaction buttons, so there is no page to go back to)
+    if not announcement.room.can_access(request.user):
+        return JsonResponse({'success': False, 'error': 'forbidden'}, status=403)
+    
+    reaction_type = request.POST.get('reaction_type')
+    if reaction_type not in AnnouncementReaction.COUNT_FIELDS:
+        return _reaction_response(request, announcement, None, messages.ERROR, "Invalid reaction type.")
+    
+    # Fetch the user's reaction under a row lock, creating it if there is none
+    # yet. Concurrent toggles (a double click) then run one after the other, so
+    # the second one never deletes or retypes a reaction the first has already
+    # changed, which would move the tallies twice.
+    with transaction.atomic():
+        reaction, created = AnnouncementReaction.objects.select_for_update().get_or_create(
+            announcement=announcement,
+            user=request.user,
+            defaults={'reaction_type': reaction_type},
+        )
         
-        reaction_type = request.POST.get('reaction_type')
-        
-        # Check if user already reacted
-        existing_reaction = AnnouncementReaction.objects.filter(
-            announcement=announcement, 
-            user=request.user
-        ).first()
-        
-        if existing_reaction:
-            if existing_reaction.reaction_type == reaction_type:
-                # Remove reaction if same type
-                existing_reaction.delete()
-                messages.info(request, "Reaction removed.")
-            else:
-                # Update reaction if different type
-                existing_reaction.reaction_type = reaction_type
-                existing_reaction.save()
-                messages.success(request, "Reaction updated!")
+        if created:
+            user_reaction, level, message = reaction_type, messages.SUCCESS, "Reaction added!"
+        elif reaction.reaction_type == reaction_type:
+            # Remove reaction if same type
+            reaction.delete()
+            user_reaction, level, message = None, messages.INFO, "Reaction removed."
         else:
-            # Create new reaction
-            AnnouncementReaction.objects.create(
-                announcement=announcement,
-                user=request.user,
-                reaction_type=reaction_type
-            )
-            messages.success(request, "Reaction added!")
-        
-        return redirect('room_detail', room_id=announcement.room.id)
+            # Update reaction if different type
+            reaction.reaction_type = reaction_type
+            reaction.save(update_fields=['reaction_type'])
+            user_reaction, level, message = reaction_type, messages.SUCCESS, "Reaction updated!"
     
-    return redirect('home')
+    return _reaction_response(request, announcement, user_reaction, level, message)
+
+
+def _reaction_response(request, announcement, user_reaction, level, message):
+    """
+    Build the response to a reaction toggle.
+    
+    Requests that ask for JSON (the reaction buttons on the room page send
+    ``Accept: application/json``) get the updated tallies so the page can be
+    patched in place. Plain form posts get a flash message and a redirect
+    back to the room, as before.
+    
+    Args:
+        request (HttpRequest): The HTTP request object
+        announcement (Announcement): The announcement that was reacted to
+        user_reaction (str): The user's reaction type after the toggle, or None
+        level (int): Message level; messages.ERROR means nothing was changed
+        message (str): Message describing the outcome
+        
+    Returns:
+        HttpResponse: JSON payload or redirect to the room detail page
+    """
+    if 'application/json' not in request.headers.get('Accept', ''):
+        messages.add_message(request, level, message)
+        return redirect('room_detail', room_id=announcement.room_id)
+    
+    if level == messages.ERROR:
+        return JsonResponse({'success': False, 'message': message}, status=400)
+    
+    # Tallies are maintained by signal handlers, so re-read them in one query
+    counts = Announcement.objects.filter(pk=announcement.pk).values(
+        *AnnouncementReaction.COUNT_FIELDS.values()
+    ).get()
+    return JsonResponse({
+        'success': True,
+        'message': message,
+        'reaction_counts': {
+            reaction_type: counts[field]
+            for reaction_type, field in AnnouncementReaction.COUNT_FIELDS.items()
+        },
+        'user_reaction': user_reaction,
+    })
 
 
 @login_required
@@ -551,20 +697,22 @@ def delete_announcement(request, announcement_id):
         - User must be admin or owner of the room
         - Displays appropriate error messages for unauthorized access
     """
-    announcement = get_object_or_404(Announcement, id=announcement_id)
+    announcement = get_object_or_404(Announcement.objects.select_related('room'), id=announcement_id)
     
     # Check if user is admin of the room
     if not announcement.room.is_admin(request.user):
         messages.error(request, "You don't have permission to delete this announcement.")
-        return redirect('room_detail', room_id=announcement.room.id)
+        return redirect('room_detail', room_id=announcement.room_id)
     
-    room_id = announcement.room.id
+    room_id = announcement.room_id
     announcement.delete()
     messages.success(request, "Announcement deleted successfully!")
     return redirect('room_detail', room_id=room_id)
 
 
 @login_required
+@require_room_role(RoomMembership.ADMIN, "You don't have permission to remove members.")
+@transaction.atomic
 def kick_member(request, room_id, user_id):
     """
     Remove a member from a room.
@@ -588,15 +736,15 @@ def kick_member(request, room_id, user_id):
         - Users cannot remove themselves
         - Only owner can remove admins
     """
-    room = get_object_or_404(Room, id=room_id)
-    
-    # Check if user has admin privileges
-    if not room.is_admin(request.user):
-        messages.error(request, "You don't have permission to remove members.")
-        return redirect('room_detail', room_id=room_id)
+    room = request.room
     
-    # Get the membership to remove
-    membership = get_object_or_404(RoomMembership, room=room, user_id=user_id)
+    # Get the membership to remove, locked so a concurrent kick or leave
+    # cannot delete it (and decrement member_count) a second time
+    membership = get_object_or_404(
+        RoomMembership.objects.select_for_update(of=('self',)).select_related('user'),
+        room=room,
+        user_id=user_id,
+    )
     
     # Owner cannot be removed
     if membership.is_owner():
@@ -604,7 +752,7 @@ def kick_member(request, room_id, user_id):
         return redirect('room_detail', room_id=room_id)
     
     # Users can't remove themselves
-    if membership.user == request.user:
+    if membership.user_id == request.user.id:
         messages.error(request, "You cannot remove yourself from the room.")
         return redirect('room_detail', room_id=room_id)
     
@@ -621,6 +769,7 @@ def kick_member(request, room_id, user_id):
 
 
 @login_required
+@require_room_role(RoomMembership.OWNER, "Only the room owner can promote users to admin.")
 def promote_user(request, room_id, user_id):
     """
     Promote a regular member to admin role.
@@ -641,33 +790,28 @@ def promote_user(request, room_id, user_id):
         - Can only promote members (not existing admins/owner)
         - Updates promotion timestamp and promoting user
     """
-    room = get_object_or_404(Room, id=room_id)
-    
-    # Only owner can promote users
-    if not room.is_owner(request.user):
-        messages.error(request, "Only the room owner can promote users to admin.")
-        return redirect('room_detail', room_id=room_id)
-    
-    # Get the membership to promote
-    membership = get_object_or_404(RoomMembership, room=room, user_id=user_id)
+    # Promote to admin in a single UPDATE that only matches regular members.
+    # update() skips the post_save handlers, so the promoted user's cached
+    # dashboards (which show their role) are dropped explicitly.
+    from django.utils import timezone
+    promoted = RoomMembership.objects.filter(
+        room_id=room_id, user_id=user_id, role=RoomMembership.MEMBER
+    ).update(role=RoomMembership.ADMIN, promoted_at=timezone.now(), promoted_by=request.user)
     
-    # Can only promote members to admin
-    if membership.role != 'member':
+    if not promoted:
+        # Not a member at all, or already an admin or owner
+        membership = get_object_or_404(RoomMembership.objects.select_related('user'), room_id=room_id, user_id=user_id)
         messages.error(request, f"{membership.user.username} is already an admin or owner.")
         return redirect('room_detail', room_id=room_id)
     
-    # Promote to admin
-    from django.utils import timezone
-    membership.role = 'admin'
-    membership.promoted_at = timezone.now()
-    membership.promoted_by = request.user
-    membership.save()
-    
-    messages.success(request, f"{membership.user.username} has been promoted to admin.")
+    invalidate_dashboards([user_id])
+    username = User.objects.filter(pk=user_id).values_list('username', flat=True).get()
+    messages.success(request, f"{username} has been promoted to admin.")
     return redirect('room_detail', room_id=room_id)
 
 
 @login_required
+@require_room_role(RoomMembership.OWNER, "Only the room owner can demote administrators.")
 def demote_user(request, room_id, user_id):
     """
     Demote an admin user back to regular member.
@@ -688,37 +832,32 @@ def demote_user(request, room_id, user_id):
         - Can only demote admins (not members or owner)
         - Clears promotion tracking information
     """
-    room = get_object_or_404(Room, id=room_id)
-    
-    # Only owner can demote users
-    if not room.is_owner(request.user):
-        messages.error(request, "Only the room owner can demote administrators.")
-        return redirect('room_detail', room_id=room_id)
-    
-    # Get the membership to demote
-    membership = get_object_or_404(RoomMembership, room=room, user_id=user_id)
-    
-    # Cannot demote owner
-    if membership.is_owner():
-        messages.error(request, "The room owner cannot be demoted.")
-        return redirect('room_detail', room_id=room_id)
-    
-    # Can only demote admins
-    if membership.role != 'admin':
-        messages.error(request, f"{membership.user.username} is not an admin.")
+    # Demote to member in a single UPDATE that only matches admins, which also
+    # leaves the owner untouched. As in promote_user, dashboards are dropped
+    # explicitly because update() skips the post_save handlers.
+    demoted = RoomMembership.objects.filter(
+        room_id=room_id, user_id=user_id, role=RoomMembership.ADMIN
+    ).update(role=RoomMembership.MEMBER, promoted_at=None, promoted_by=None)
+    
+    if not demoted:
+        membership = get_object_or_404(RoomMembership.objects.select_related('user'), room_id=room_id, user_id=user_id)
+        
+        # Cannot demote owner
+        if membership.is_owner():
+            messages.error(request, "The room owner cannot be demoted.")
+        # Can only demote admins
+        else:
+            messages.error(request, f"{membership.user.username} is not an admin.")
         return redirect('room_detail', room_id=room_id)
     
-    # Demote to member
-    membership.role = 'member'
-    membership.promoted_at = None
-    membership.promoted_by = None
-    membership.save()
-    
-    messages.success(request, f"{membership.user.username} has been demoted to member.")
+    invalidate_dashboards([user_id])
+    username = User.objects.filter(pk=user_id).values_list('username', flat=True).get()
+    messages.success(request, f"{username} has been demoted to member.")
     return redirect('room_detail', room_id=room_id)
 
 
 @login_required
+@require_room_role(RoomMembership.OWNER, "Only the room owner can delete this room.", redirect_to='home')
 def delete_room(request, room_id):
     """
     Delete a room and all associated data.
@@ -744,12 +883,7 @@ def delete_room(request, room_id):
         This permanently deletes all room data including announcements
         and member interactions. Use with caution.
     """
-    room = get_object_or_404(Room, id=room_id)
-    
-    # Only owner can delete the room
-    if not room.is_owner(request.user):
-        messages.error(request, "Only the room owner can delete this room.")
-        return redirect('home')
+    room = request.room
     
     room_name = room.room_name
     room.delete()
@@ -56,6 +56,9 @@ LOGIN_REDIRECT_URL = "home"   # where to go after login/signup
 LOGOUT_REDIRECT_URL = "login" # where to go after logout
 LOGIN_URL = "sign_up"           # where to redirect if @login_required fails
 
+# With no explicit 'loaders' option, Django wraps the app directories loader
+# in django.template.loaders.cached.Loader, so templates are parsed once per
+# process rather than on every render.
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
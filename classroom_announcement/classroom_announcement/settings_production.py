@@ -25,25 +25,61 @@ ALLOWED_HOSTS = [
 # ALLOWED_HOSTS.append('your-custom-domain.com')
 
 # Database configuration for production
-# Using SQLite for simplicity, but consider PostgreSQL for production
+# Cloud SQL PostgreSQL. SQLite is not an option here: the container filesystem
+# is wiped on every restart and SQLite serializes writes across instances.
+# DB_HOST may be a TCP address or the Cloud SQL socket directory
+# (/cloudsql/PROJECT:REGION:INSTANCE); sslmode is ignored for sockets.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('DB_NAME'),
+        'USER': os.getenv('DB_USER'),
+        'PASSWORD': os.getenv('DB_PASSWORD'),
+        'HOST': os.getenv('DB_HOST'),
+        'PORT': os.getenv('DB_PORT', '5432'),
+        # Keep connections open between requests instead of reconnecting
+        # (TCP + TLS + auth) on every one, and check them before reuse
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'sslmode': os.getenv('DB_SSLMODE', 'require'),
+        },
     }
 }
 
-# For PostgreSQL (uncomment if you want to use Cloud SQL):
-# DATABASES = {
-#     'default': {
-#         'ENGINE': 'django.db.backends.postgresql',
-#         'NAME': os.getenv('DB_NAME'),
-#         'USER': os.getenv('DB_USER'),
-#         'PASSWORD': os.getenv('DB_PASSWORD'),
-#         'HOST': os.getenv('DB_HOST'),
-#         'PORT': os.getenv('DB_PORT', '5432'),
-#     }
-# }
+# Cache configuration
+# The home and account dashboards are cached per user, so every instance must
+# share one cache for signal-driven invalidation to reach all of them.
+# Set REDIS_URL (e.g. redis://10.0.0.3:6379/0 for Memorystore) in production;
+# without it each instance falls back to its own in-memory cache.
+REDIS_URL = os.getenv('REDIS_URL')
+
+# Prefix for every cache key, so services sharing one Redis cannot collide
+CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'classroom')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': CACHE_KEY_PREFIX,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'KEY_PREFIX': CACHE_KEY_PREFIX,
+        }
+    }
+
+CACHE_MIDDLEWARE_KEY_PREFIX = CACHE_KEY_PREFIX
+
+# Sessions are read from the cache and written through to the database, so
+# authenticated requests skip the session query while a cache flush, Redis
+# eviction or the per-instance fallback above never logs anyone out.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'default'
 
 # Static files configuration for production
 STATIC_URL = '/static/'
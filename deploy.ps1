@@ -7,8 +7,22 @@ $SERVICE_NAME = "classroom-announcement-app"
 $REGION = "us-central1"  # Change to your preferred region
 $IMAGE_NAME = "gcr.io/$PROJECT_ID/$SERVICE_NAME"
 
+# Production uses Cloud SQL PostgreSQL; set these before running the script:
+#   $env:CLOUD_SQL_INSTANCE  Instance connection name (PROJECT:REGION:INSTANCE)
+#   $env:DB_NAME, $env:DB_USER, $env:DB_PASSWORD
+
 Write-Host "🚀 Starting deployment to Google Cloud Run..." -ForegroundColor Green
 
+# Check the database settings before building anything
+$MISSING_VARS = @("CLOUD_SQL_INSTANCE", "DB_NAME", "DB_USER", "DB_PASSWORD") | Where-Object {
+    [string]::IsNullOrEmpty([Environment]::GetEnvironmentVariable($_))
+}
+if ($MISSING_VARS) {
+    Write-Host "❌ Missing database settings: $($MISSING_VARS -join ', ')" -ForegroundColor Red
+    Write-Host "Set them before deploying (see DEPLOYMENT.md, Database section)." -ForegroundColor Yellow
+    exit 1
+}
+
 # Check if gcloud is installed
 if (!(Get-Command gcloud -ErrorAction SilentlyContinue)) {
     Write-Host "❌ Google Cloud SDK is not installed. Please install it first." -ForegroundColor Red
@@ -52,7 +66,8 @@ gcloud run deploy $SERVICE_NAME `
     --cpu 1 `
     --min-instances 0 `
     --max-instances 10 `
-    --set-env-vars DJANGO_SETTINGS_MODULE=classroom_announcement.settings_production
+    --add-cloudsql-instances $env:CLOUD_SQL_INSTANCE `
+    --update-env-vars "DJANGO_SETTINGS_MODULE=classroom_announcement.settings_production,DB_NAME=$env:DB_NAME,DB_USER=$env:DB_USER,DB_PASSWORD=$env:DB_PASSWORD,DB_HOST=/cloudsql/$env:CLOUD_SQL_INSTANCE"
 
 Write-Host "✅ Deployment complete!" -ForegroundColor Green
 Write-Host "🌐 Your application is available at:" -ForegroundColor Green
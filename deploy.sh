@@ -9,8 +9,25 @@ SERVICE_NAME="classroom-announcement-app"
 REGION="us-central1"  # Change to your preferred region
 IMAGE_NAME="gcr.io/${PROJECT_ID}/${SERVICE_NAME}"
 
+# Production uses Cloud SQL PostgreSQL; export these before running the script:
+#   CLOUD_SQL_INSTANCE  Instance connection name (PROJECT:REGION:INSTANCE)
+#   DB_NAME, DB_USER, DB_PASSWORD
+
 echo "🚀 Starting deployment to Google Cloud Run..."
 
+# Check the database settings before building anything
+MISSING_VARS=""
+for VAR in CLOUD_SQL_INSTANCE DB_NAME DB_USER DB_PASSWORD; do
+    if [ -z "${!VAR}" ]; then
+        MISSING_VARS="${MISSING_VARS} ${VAR}"
+    fi
+done
+if [ -n "${MISSING_VARS}" ]; then
+    echo "❌ Missing database settings:${MISSING_VARS}"
+    echo "Export them before deploying (see DEPLOYMENT.md, Database section)."
+    exit 1
+fi
+
 # Check if gcloud is installed
 if ! command -v gcloud &> /dev/null; then
     echo "❌ Google Cloud SDK is not installed. Please install it first."
@@ -54,7 +71,8 @@ gcloud run deploy ${SERVICE_NAME} \
     --cpu 1 \
     --min-instances 0 \
     --max-instances 10 \
-    --set-env-vars DJANGO_SETTINGS_MODULE=classroom_announcement.settings_production
+    --add-cloudsql-instances ${CLOUD_SQL_INSTANCE} \
+    --update-env-vars "DJANGO_SETTINGS_MODULE=classroom_announcement.settings_production,DB_NAME=${DB_NAME},DB_USER=${DB_USER},DB_PASSWORD=${DB_PASSWORD},DB_HOST=/cloudsql/${CLOUD_SQL_INSTANCE}"
 
 echo "✅ Deployment complete!"
 echo "🌐 Your application is available at:"